@@ -0,0 +1,91 @@
+"""Compare the per-frame cost of the UYVY and MJPG capture paths of CV2Camera.
+
+By default this runs offline (no camera needed): a test image is scaled to 1920x1080 and converted into the raw
+buffers the camera would deliver, then we time the work needed to turn each buffer into the 640x480 machine vision
+frame.  With --live the same comparison is done against /dev/camera (which also includes USB transfer time).
+"""
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+mv_size = (640, 480)
+full_size = (1920, 1080)
+
+
+def bgr_to_uyvy(bgr: np.ndarray) -> np.ndarray:
+    """Pack a BGR image into the UYVY (4:2:2) layout a USB camera sends"""
+    yuv = cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV)
+    y = yuv[..., 0]
+    u = ((yuv[:, 0::2, 1].astype(np.uint16) + yuv[:, 1::2, 1]) // 2).astype(np.uint8)
+    v = ((yuv[:, 0::2, 2].astype(np.uint16) + yuv[:, 1::2, 2]) // 2).astype(np.uint8)
+    uyvy = np.empty((bgr.shape[0], bgr.shape[1], 2), dtype=np.uint8)
+    uyvy[:, 0::2, 0] = u
+    uyvy[:, 1::2, 0] = v
+    uyvy[..., 1] = y
+    return uyvy
+
+
+def time_it(name: str, fn, iterations: int) -> None:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    ms = (time.perf_counter() - start) * 1000 / iterations
+    print(f"{name:45} {ms:8.2f} ms/frame")
+
+
+def offline(image_path: str, iterations: int) -> None:
+    bgr = cv2.resize(cv2.imread(image_path), full_size, interpolation=cv2.INTER_AREA)
+    uyvy = bgr_to_uyvy(bgr)
+    _, jpeg = cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, 90])
+    print(f"Raw frame sizes: UYVY {uyvy.nbytes / 1e6:.1f} MB, MJPG {jpeg.nbytes / 1e6:.2f} MB")
+
+    def uyvy_path():
+        frame = cv2.cvtColor(uyvy, cv2.COLOR_YUV2BGR_UYVY)
+        return cv2.resize(frame, mv_size, interpolation=cv2.INTER_LANCZOS4)
+
+    def mjpg_path(flag):
+        def f():
+            frame = cv2.imdecode(jpeg, flag)
+            return cv2.resize(frame, mv_size, interpolation=cv2.INTER_LANCZOS4)
+        return f
+
+    time_it("UYVY convert + resize (current)", uyvy_path, iterations)
+    time_it("MJPG full decode + resize", mjpg_path(cv2.IMREAD_COLOR), iterations)
+    time_it("MJPG 1/2 decode + resize", mjpg_path(cv2.IMREAD_REDUCED_COLOR_2), iterations)
+    time_it("MJPG 1/4 decode + resize", mjpg_path(cv2.IMREAD_REDUCED_COLOR_4), iterations)
+
+
+def live(iterations: int) -> None:
+    for fourcc in ["UYVY", "MJPG"]:
+        cam = cv2.VideoCapture("/dev/camera", cv2.CAP_V4L2)
+        cam.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        cam.set(cv2.CAP_PROP_FRAME_WIDTH, full_size[0])
+        cam.set(cv2.CAP_PROP_FRAME_HEIGHT, full_size[1])
+        if fourcc == "MJPG":
+            cam.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+
+        def read():
+            ok, frame = cam.read()
+            assert ok, "camera read failed"
+            if frame.ndim < 3:
+                frame = cv2.imdecode(frame, cv2.IMREAD_REDUCED_COLOR_2)
+            return cv2.resize(frame, mv_size, interpolation=cv2.INTER_LANCZOS4)
+
+        time_it(f"{fourcc} live read + decode + resize", read, iterations)
+        cam.release()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--live", help="Benchmark the real camera at /dev/camera", action="store_true")
+    parser.add_argument("--iterations", "-n", type=int, default=50)
+    parser.add_argument("--image", default=os.path.join(os.path.dirname(__file__), "..", "..", "tests", "image", "cat.jpg"))
+    args = parser.parse_args()
+    if args.live:
+        live(args.iterations)
+    else:
+        offline(args.image, args.iterations)
@@ -6,6 +6,7 @@ import cv2
 import numpy as np
 
 from .Recognizer import ImageDetection, Recognizer
+from .util import app_config
 
 logger = logging.getLogger()
 
@@ -129,6 +130,8 @@ class BallRecognizer(Recognizer):
 
     def __init__(self):
         super().__init__()
+        # balls are big and simple, so this can usually run at a lower resolution than the other recognizers
+        self.resolution = app_config.settings['BallResolution']
 
     def do_detection(self, image: np.ndarray) -> list[ImageDetection]:
         """
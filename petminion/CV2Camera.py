@@ -7,13 +7,22 @@ import cv2
 import numpy
 
 from .Camera import Camera, CameraDisconnectedError
+from .FrameGrabber import FrameGrabber
 from .RateLimit import RateLimit, SimpleLimit
-from .util import has_windows
+from .util import app_config, has_windows
 
 logger = logging.getLogger()
 
 live_capture_limit = SimpleLimit(5)  # every few seconds
 
+# imdecode flags for the supported MJPG decode scales
+reduced_decode_flags = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8
+}
+
 _started = False
 
 hsv = None
@@ -87,7 +96,17 @@ class CV2Camera(Camera):
             cam.set(cv2.CAP_PROP_AUTO_WB, 0)
             cam.set(cv2.CAP_PROP_WB_TEMPERATURE, 3222)  # from crude testing in my living room
 
-        cam.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('U', 'Y', 'V', 'Y'))  # type: ignore
+        fourcc = app_config.settings['CameraFormat'].upper()
+        self.is_mjpeg = fourcc == 'MJPG'
+        self.decode_scale = app_config.settings.getint('CameraDecodeScale')
+        if self.decode_scale not in reduced_decode_flags:
+            raise ValueError(f"CameraDecodeScale must be one of { list(reduced_decode_flags) }")
+        self._last_jpeg: Optional[numpy.ndarray] = None
+
+        cam.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))  # type: ignore
+        if self.is_mjpeg:
+            # Ask for the undecoded JPEG bytes, so we can choose the decode resolution per frame
+            cam.set(cv2.CAP_PROP_CONVERT_RGB, 0)
         # we can get a much higher frame rate if we use H264, but opencv doesn't automatically decompress it
         # cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('H', '2', '6', '4'))
         cam.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
@@ -107,7 +126,7 @@ class CV2Camera(Camera):
         # https://pedja.supurovic.net/setting-up-logitech-c920-webcam-for-the-best-video-complete-guide/?lang=lat
 
         logger.info(
-            f"Camera width={ width }, height={height}, exposure={exp}")
+            f"Camera width={ width }, height={height}, exposure={exp}, format={fourcc}")
 
         if width != 1920:
             logger.warning("Requested resolution of 1920x1080 not available, problems might occur...")
@@ -115,8 +134,31 @@ class CV2Camera(Camera):
         if (not cam.isOpened() or width == 0):
             raise ConnectionError("Can't access camera")
 
+        # USB cameras keep queueing frames while we are busy running machine vision, so we read them on a background
+        # thread and only ever process the newest one.
+        self.grabber = FrameGrabber(self._grab, name="CV2Camera")
+
+    def _grab(self, into: Optional[numpy.ndarray]) -> numpy.ndarray:
+        """Read a frame from the device (called on the grabber thread)
+
+        Args:
+            into (Optional[numpy.ndarray]): A buffer from a previous frame, which will be reused if possible
+
+        Raises:
+            CameraDisconnectedError: Raised if the camera is removed
+
+        Returns:
+            numpy.ndarray: A frame from the camera
+        """
+        camGood, camImage = self.cam.read(into)
+        if not camGood:
+            raise CameraDisconnectedError("Camera read error")
+        return camImage
+
     def read_image(self) -> numpy.ndarray:
-        """Read a frame from the camera
+        """Read the newest frame from the camera
+
+        The returned frame is not copied, it is only valid until the next call to read_image().
 
         Raises:
             CameraDisconnectedError: Raised if the camera is removed
@@ -124,12 +166,33 @@ class CV2Camera(Camera):
         Returns:
             numpy.ndarray: A frame from the camera
         """
-        # reading the input using the camera
-        camGood, camImage = self.cam.read()
+        frame = self.grabber.latest()
+        if self.is_mjpeg and frame.ndim < 3:
+            # We have the raw JPEG, decode a (cheaper) reduced resolution image for machine vision
+            self._last_jpeg = frame
+            frame = cv2.imdecode(frame, reduced_decode_flags[self.decode_scale])
+            if frame is None:
+                raise CameraDisconnectedError("Camera sent a corrupt JPEG frame")
+        return frame
 
-        # If image will detected without any error,
-        # show result
-        if camGood:
-            return camImage
-        else:
-            raise CameraDisconnectedError("Camera read error")
+    def full_resolution(self, image: numpy.ndarray) -> numpy.ndarray:
+        """Get the full resolution version of the frame most recently returned by read_image()
+
+        In MJPG mode this decodes the saved JPEG again at full size, so only frames which are needed for videos
+        or captures pay that cost.
+
+        Args:
+            image (numpy.ndarray): The frame returned by the last call to read_image()
+
+        Returns:
+            numpy.ndarray: The frame at full capture resolution
+        """
+        if self._last_jpeg is None or self.decode_scale == 1:
+            return image
+        return cv2.imdecode(self._last_jpeg, cv2.IMREAD_COLOR)
+
+    def close(self) -> None:
+        """Stop capturing and release the camera device"""
+        self.grabber.stop()
+        self.cam.release()
+        logger.info(f"Camera closed, captured {self.grabber.captured_frames} frames, dropped {self.grabber.dropped_frames}")
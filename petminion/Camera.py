@@ -28,6 +28,24 @@ class Camera:
         """
         raise NotImplementedError
 
+    def full_resolution(self, image: numpy.ndarray) -> numpy.ndarray:
+        """Get the full resolution version of the frame most recently returned by read_image()
+
+        Cameras which can deliver cheaper reduced resolution frames override this to do the expensive work only when
+        needed (for videos or captures).  The default implementation returns the image unchanged.
+
+        Args:
+            image (numpy.ndarray): The frame returned by the last call to read_image()
+
+        Returns:
+            numpy.ndarray: The frame at full capture resolution
+        """
+        return image
+
+    def close(self) -> None:
+        """Release any resources held by this camera.  The default implementation does nothing."""
+        pass
+
 
 class SimCamera(Camera):
     """A simulated camera that fakes images by reading files from a filesystem.
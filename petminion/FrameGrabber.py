@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .Camera import CameraDisconnectedError
+
+logger = logging.getLogger()
+
+
+class FrameGrabber:
+    """Reads frames on a background thread so that capture never blocks image processing.
+
+    The capture thread reads into a small ring of reused buffers and always publishes the newest frame.  Frames which
+    are replaced before anyone asks for them are counted as dropped.  A frame returned by latest() is handed out
+    without copying and stays valid until the next call to latest() - the capture thread never writes into the slot
+    the consumer is currently using.
+
+    Attributes:
+        captured_frames (int): The number of frames read from the device.
+        dropped_frames (int): The number of frames which were replaced by a newer frame before being consumed.
+        capture_time (float): The time.monotonic() timestamp of the frame most recently returned by latest().
+    """
+
+    def __init__(self, read_fn: Callable[[Optional[Any]], Any], num_slots: int = 3, name: str = "FrameGrabber"):
+        """Constructor
+
+        Args:
+            read_fn: Called on the capture thread to read a frame.  It is passed the old contents of a free slot (or None),
+                which it may reuse as the destination buffer.  It must raise an exception if the device fails.
+            num_slots (int, optional): Number of buffers in the ring, must be at least three (latest, in-use and
+                being-written).  Defaults to 3.
+            name (str, optional): The name of the capture thread.  Defaults to "FrameGrabber".
+        """
+        assert num_slots >= 3
+        self._read = read_fn
+        self._slots: list[Any] = [None] * num_slots
+        self._timestamps = [0.0] * num_slots
+        self._latest = -1  # slot index of the newest frame
+        self._in_use = -1  # slot index currently owned by the consumer
+        self._next = 0  # round robin write position
+        self._seq = 0  # incremented for every published frame
+        self._consumed_seq = 0  # the seq number most recently handed out
+        self._error: Optional[Exception] = None
+        self._running = True
+        self._cond = threading.Condition()
+
+        self.captured_frames = 0
+        self.dropped_frames = 0
+        self.capture_time = 0.0
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _free_slot(self) -> int:
+        """Find a slot which is neither the newest frame nor in use by the consumer (must be called with the lock held)"""
+        n = len(self._slots)
+        for i in range(n):
+            idx = (self._next + i) % n
+            if idx != self._latest and idx != self._in_use:
+                self._next = (idx + 1) % n
+                return idx
+        raise AssertionError("FrameGrabber has no free slots")
+
+    def _run(self) -> None:
+        """The capture thread"""
+        while self._running:
+            with self._cond:
+                idx = self._free_slot()
+
+            try:
+                frame = self._read(self._slots[idx])
+            except Exception as e:
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                self._slots[idx] = frame
+                self._timestamps[idx] = time.monotonic()
+                if self._seq != self._consumed_seq:
+                    self.dropped_frames += 1  # nobody looked at the previous frame
+                self._latest = idx
+                self._seq += 1
+                self.captured_frames += 1
+                self._cond.notify_all()
+
+    @property
+    def frame_age(self) -> float:
+        """How many seconds ago the frame most recently returned by latest() was captured"""
+        return time.monotonic() - self.capture_time
+
+    def latest(self, timeout: float = 5.0) -> Any:
+        """Wait for a frame newer than the last one returned and return it.
+
+        Args:
+            timeout (float, optional): Max seconds to wait for a new frame.  Defaults to 5.0.
+
+        Raises:
+            CameraDisconnectedError: If the capture thread failed or no frame arrived within the timeout.
+
+        Returns:
+            The newest frame, valid until the next call to latest().
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._seq != self._consumed_seq or self._error is not None, timeout):
+                raise CameraDisconnectedError("Timeout waiting for camera frame")
+            if self._seq == self._consumed_seq:
+                raise CameraDisconnectedError(f"Camera read error: {self._error}")
+
+            self._in_use = self._latest
+            self._consumed_seq = self._seq
+            self.capture_time = self._timestamps[self._in_use]
+            return self._slots[self._in_use]
+
+    def stop(self) -> None:
+        """Ask the capture thread to exit and wait for it"""
+        self._running = False
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+        logger.debug(f"Frame grabber stopped, captured={self.captured_frames}, dropped={self.dropped_frames}")
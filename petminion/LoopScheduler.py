@@ -0,0 +1,77 @@
+import logging
+import time
+
+logger = logging.getLogger()
+
+
+class LoopScheduler:
+    """
+    Decides how long the main loop should sleep between frames.
+
+    The per-iteration cost is measured and the sleep chosen so that we never use more than duty_cycle of a CPU core
+    (leaving time for critical things like zigbee) and never run faster than the target frame period.  When the scene
+    is idle we use a longer period, when something interesting (a pet or a token) is visible we speed up.
+
+    Attributes:
+        period (float): The most recently chosen seconds per frame.
+        avg_cost (float): A running average of how many seconds each iteration takes (excluding our sleep).
+    """
+
+    def __init__(self, active_period: float = 0.2, idle_period: float = 1.0, duty_cycle: float = 0.5,
+                 min_sleep: float = 0.01):
+        """
+        Initializes the LoopScheduler.
+
+        Args:
+            active_period (float, optional): Target seconds per frame while the scene is active. Defaults to 0.2.
+            idle_period (float, optional): Target seconds per frame while the scene is idle. Defaults to 1.0.
+            duty_cycle (float, optional): Max fraction of the time we are allowed to be busy. Defaults to 0.5.
+            min_sleep (float, optional): Always sleep at least this long, so other threads can run. Defaults to 0.01.
+        """
+        self.active_period = active_period
+        self.idle_period = idle_period
+        self.duty_cycle = duty_cycle
+        self.min_sleep = min_sleep
+        self.period = idle_period
+        self.avg_cost = 0.0
+        self.is_active = False
+        self.wake_time = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """The current frame rate in frames per second"""
+        return 1.0 / self.period
+
+    def next_delay(self, cost: float, is_active: bool) -> float:
+        """
+        Choose the delay before the next iteration.
+
+        Args:
+            cost (float): How many seconds the iteration which just finished took.
+            is_active (bool): True if something interesting is currently visible.
+
+        Returns:
+            float: The number of seconds to sleep.
+        """
+        self.avg_cost = cost if not self.avg_cost else 0.9 * self.avg_cost + 0.1 * cost
+        target = self.active_period if is_active else self.idle_period
+        old_period = self.period
+        self.period = max(target, self.avg_cost / self.duty_cycle)
+
+        if is_active != self.is_active or abs(self.period - old_period) > 0.25 * old_period:
+            logger.debug(
+                f'Scene {"active" if is_active else "idle"}, running at { self.rate:.1f} fps (each frame takes { self.avg_cost * 1000:.0f} ms)')
+        self.is_active = is_active
+
+        return max(self.min_sleep, self.period - cost)
+
+    def sleep(self, is_active: bool) -> None:
+        """
+        Called at the end of each iteration, sleeps until the next iteration should start.
+
+        Args:
+            is_active (bool): True if something interesting is currently visible.
+        """
+        now = time.monotonic()
+        time.sleep(self.next_delay(now - self.wake_time, is_active))
+        self.wake_time = time.monotonic()
@@ -0,0 +1,89 @@
+import logging
+from typing import Optional
+
+import cv2
+import numpy
+
+from .RateLimit import SimpleLimit
+from .Recognizer import ImageDetection, Recognizer, RecognizerStage
+
+logger = logging.getLogger()
+
+motion_size = (80, 60)  # frames are compared at this (tiny) resolution
+
+
+class MotionGate(RecognizerStage):
+    """
+    Only runs the (expensive) inner recognizer if the scene has changed, otherwise the previous detections are reused.
+
+    Each frame is shrunk to a tiny grayscale image and compared with the frame the inner recognizer last saw.  Comparing
+    against that frame (rather than the immediately previous one) means slow changes still eventually trigger a detection.
+
+    Attributes:
+        frames (int): How many frames we have been asked to process.
+        skipped (int): How many of those frames reused the previous detections.
+    """
+
+    def __init__(self, inner: Recognizer, changed_fraction: float = 0.005, pixel_threshold: int = 25,
+                 force_interval: float = 30.0):
+        """
+        Initializes the MotionGate.
+
+        Args:
+            inner (Recognizer): The recognizer to gate.
+            changed_fraction (float, optional): The fraction of pixels which must change to count as motion. Defaults to 0.005.
+            pixel_threshold (int, optional): How much a gray level must change for that pixel to count as changed. Defaults to 25.
+            force_interval (float, optional): Always run the inner recognizer at least this often (in seconds). Defaults to 30.
+        """
+        super().__init__(inner)
+        self.changed_fraction = changed_fraction
+        self.pixel_threshold = pixel_threshold
+        self.force_limit = SimpleLimit(force_interval)
+        self.reference: Optional[numpy.ndarray] = None
+        self.detections: list[ImageDetection] = []
+        self.frames = 0
+        self.skipped = 0
+
+    @property
+    def skip_ratio(self) -> float:
+        """The fraction of frames which did not need the inner recognizer"""
+        return self.skipped / self.frames if self.frames else 0.0
+
+    def has_motion(self, small: numpy.ndarray) -> bool:
+        """
+        Check if a frame is different enough from our reference frame.
+
+        Args:
+            small (numpy.ndarray): A grayscale frame at motion_size.
+
+        Returns:
+            bool: True if the scene has changed.
+        """
+        if self.reference is None or self.reference.shape != small.shape:
+            return True
+        diff = cv2.absdiff(small, self.reference)
+        changed = cv2.countNonZero(cv2.threshold(diff, self.pixel_threshold, 255, cv2.THRESH_BINARY)[1])
+        return changed > self.changed_fraction * small.size
+
+    def do_detection(self, image: numpy.ndarray) -> list[ImageDetection]:
+        """
+        Performs object detection on the given image, if the scene has changed since the last detection.
+
+        Args:
+            image: A numpy array representing the image.
+
+        Returns:
+            A list of ImageDetection objects.
+        """
+        self.frames += 1
+        small = cv2.cvtColor(cv2.resize(image, motion_size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
+        if self.has_motion(small) or self.force_limit.is_runnable:
+            self.force_limit.set_ran()
+            self.reference = small
+            self.detections = self.inner.do_detection(image)
+        else:
+            self.skipped += 1
+
+        if self.frames % 1000 == 0:
+            logger.debug(f'Motion gate skipped { self.skip_ratio:.0%} of frames')
+        return self.detections
@@ -6,28 +6,97 @@ import numpy
 
 from .ImageRecognizer import ImageDetection, ImageRecognizer
 
+# The named resolutions available from ProcessedImage.scaled() as (width, height), a height of None keeps the aspect ratio.
+# 'full' is also accepted and means the full resolution raw_image.
+resolutions = {
+    'mv': (640, 480),  # the standard machine vision resolution, also used for captures and the live view
+    'small': (320, 240),  # for cheap recognizers which don't need much detail
+    'gif': (320, None),  # animated gifs for notifications
+}
+
+
+def scale_detection(d: ImageDetection, sx: float, sy: float) -> ImageDetection:
+    """Scale the bounding box of a detection (detections without a box are returned unchanged)"""
+    if d.x1 < 0:
+        return d
+    return d._replace(x1=int(d.x1 * sx), y1=int(d.y1 * sy), x2=int(d.x2 * sx), y2=int(d.y2 * sy))
+
 
 class ProcessedImage:
     """
     Represents a processed image with associated annotations, classifications, and detections.
 
+    Images at other resolutions are available from scaled(), each one is computed at most once per frame.
+
     Parameters:
     - recognizers (list[ImageRecognizer]): A list of ImageRecognizer objects used for image processing.
     - raw_image (numpy.ndarray): The raw image to be processed.
+    - full_image (Callable, optional): If the camera provided a reduced resolution raw_image, a function which
+      returns the full resolution version.  It is only called if someone needs the full resolution frame.
     """
 
-    def __init__(self, recognizers: list[ImageRecognizer], raw_image: numpy.ndarray):
+    def __init__(self, recognizers: list[ImageRecognizer], raw_image: numpy.ndarray,
+                 full_image: typing.Optional[typing.Callable[[], numpy.ndarray]] = None):
         self.__recognizers = recognizers
+        self.__full_image = full_image
+        self.__pyramid: dict[str, numpy.ndarray] = {}
+        self.__capture = raw_image  # the image as provided by the camera
+        if full_image is None:
+            self.raw_image = raw_image  # we already have the full resolution image
+
+    @cached_property
+    def raw_image(self) -> numpy.ndarray:
+        """
+        Returns the full resolution image (used for videos and captures), fetched on first use.
+        """
+        return self.__full_image()
+
+    @property
+    def image(self) -> numpy.ndarray:
+        """
+        Returns the image at the resolution used for machine vision purposes.
+        """
+        return self.scaled('mv')
+
+    def scaled(self, name: str) -> numpy.ndarray:
+        """
+        Returns the image at one of the named resolutions.  The first request for a resolution resizes the smallest
+        already available image which is at least that big, later requests reuse the result.
+
+        Args:
+            name (str): A key from resolutions, or 'full' for the full resolution raw_image.
+
+        Returns:
+            numpy.ndarray: The resized image (which must not be modified).
+        """
+        if name == 'full':
+            return self.raw_image
+
+        img = self.__pyramid.get(name)
+        if img is None:
+            w, h = resolutions[name]
+            capture = self.__capture
+            if h is None:
+                h = round(capture.shape[0] * w / capture.shape[1])
+
+            # Find the cheapest source image (we never use raw_image here, because that might need an expensive decode)
+            source = capture
+            for level in self.__pyramid.values():
+                if w <= level.shape[1] < source.shape[1] and h <= level.shape[0]:
+                    source = level
+
+            if source.shape[1] == w and source.shape[0] == h:
+                img = source
+            else:
+                img = cv2.resize(source, (w, h), interpolation=cv2.INTER_AREA)
+            self.__pyramid[name] = img
+        return img
 
-        # for machine vision purposes we use a lower res image for processing
-        image = raw_image
-        w = image.shape[1]  # Set w to the width of the frame
-        if (w != 640):
-            # Resize the frame to 640x480
-            dest_size = (640, 480)
-            image = cv2.resize(image, dest_size, interpolation=cv2.INTER_LANCZOS4)
-        self.raw_image = raw_image
-        self.image = image
+    def __scaled_for(self, recognizer: ImageRecognizer) -> tuple[numpy.ndarray, float, float]:
+        """Returns the image a recognizer wants and the factors to scale its results back to machine vision coordinates"""
+        img = self.scaled(recognizer.resolution)
+        mv = self.image
+        return img, mv.shape[1] / img.shape[1], mv.shape[0] / img.shape[0]
 
     @property
     def annotated(self) -> typing.Optional[numpy.ndarray]:
@@ -48,7 +117,8 @@ class ProcessedImage:
         """
         classifications = []
         for recognizer in self.__recognizers:
-            classifications.extend(recognizer.do_classification(self.image))
+            img, _, _ = self.__scaled_for(recognizer)
+            classifications.extend(recognizer.do_classification(img))
         return classifications
 
     @cached_property
@@ -58,7 +128,10 @@ class ProcessedImage:
         """
         detections = []
         for recognizer in self.__recognizers:
-            d = recognizer.do_detection(self.image)
+            img, sx, sy = self.__scaled_for(recognizer)
+            d = recognizer.do_detection(img)
+            if sx != 1.0 or sy != 1.0:
+                d = [scale_detection(x, sx, sy) for x in d]
             detections.extend(d)
 
         return detections
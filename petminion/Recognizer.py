@@ -33,12 +33,15 @@ class Recognizer:
     Attributes:
         detector: An instance of ObjectDetection class for object detection.
         classifier: An instance of ImageClassification class for image classification.
+        resolution (str): The name of the ProcessedImage resolution this recognizer wants its images at.
 
     Methods:
         do_detection: Performs object detection on an image and returns annotated image and a list of ImageDetection objects.
         do_classification: Performs image classification on an image and returns a list of ImageDetection objects.
     """
 
+    resolution = 'mv'
+
     def __init__(self):
         """
         Initializes the Recognizer class.
@@ -71,3 +74,30 @@ class Recognizer:
 
         # Stub always claims no classifications
         return []
+
+
+class RecognizerStage(Recognizer):
+    """
+    A recognizer which wraps another recognizer, so that extra processing (gating, caching etc...) can be inserted in
+    front of it.  The default implementation just passes everything through to the inner recognizer.
+
+    Attributes:
+        inner: The wrapped Recognizer.
+    """
+
+    def __init__(self, inner: Recognizer):
+        """
+        Initializes the RecognizerStage.
+
+        Args:
+            inner: The Recognizer to wrap.
+        """
+        super().__init__()
+        self.inner = inner
+        self.resolution = inner.resolution
+
+    def do_detection(self, image: numpy.ndarray) -> list[ImageDetection]:
+        return self.inner.do_detection(image)
+
+    def do_classification(self, image: numpy.ndarray) -> list[ImageDetection]:
+        return self.inner.do_classification(image)
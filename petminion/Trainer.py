@@ -2,7 +2,6 @@ import configparser
 import logging
 import os
 import tempfile
-import time as systime
 from typing import Optional
 
 from .BallRecognizer import BallRecognizer
@@ -12,7 +11,9 @@ from .CV2Camera import CV2Camera  # noqa: F401 needed for find at runtime
 from .Feeder import *  # noqa: F403 must use * here because we find classnames at runtime
 # Not yet ready: from .PiCamera import PiCamera
 from .ImageRecognizer import ImageRecognizer
+from .LoopScheduler import LoopScheduler
 from .MastodonClient import MastodonClient
+from .MotionGate import MotionGate
 from .ProcessedImage import ProcessedImage
 from .PushoverClient import PushoverClient
 from .RateLimit import RateLimit, SimpleLimit
@@ -89,13 +90,20 @@ class Trainer:
         self.feeder = Feeder() if is_simulated else class_by_name("Feeder")()  # noqa: F405
         self.image: Optional[ProcessedImage] = None
 
-        self.recognizers = [ImageRecognizer(), BallRecognizer()]  # FIXME, perhaps this should be part of the rule instead?
+        detector = ImageRecognizer()
+        if app_config.settings.getboolean('MotionGate'):
+            detector = MotionGate(detector, app_config.settings.getfloat('MotionFraction'),
+                                  force_interval=app_config.settings.getfloat('MotionForceSeconds'))
+        self.recognizers = [detector, BallRecognizer()]  # FIXME, perhaps this should be part of the rule instead?
         self.color_corrector = ColorCorrector()
         self.corrector_check_rate = SimpleLimit(60)  # 1 check per minute
 
+        s = app_config.settings
+        self.scheduler = LoopScheduler(s.getfloat('ActiveFramePeriod'), s.getfloat('IdleFramePeriod'), s.getfloat('DutyCycle'))
+
     def capture_image(self) -> None:
         """Grab a new image from the camera"""
-        img = self.camera.read_image()
+        raw = img = self.camera.read_image()
 
         def check_for_card() -> None:
             if self.color_corrector.look_for_card(img):
@@ -112,7 +120,13 @@ class Trainer:
         else:
             check_for_card()
 
-        self.image = ProcessedImage(self.recognizers, img)
+        def full_image():
+            full = self.camera.full_resolution(raw)
+            if full is raw:
+                return img  # we already have this one
+            return self.color_corrector.correct_image(full) if self.color_corrector.is_ready else full
+
+        self.image = ProcessedImage(self.recognizers, img, full_image)
 
     def start_social(self, status_text: str, capture_seconds=64) -> None:
         """The pet just did something interesting, start a social media movie - posting capture_seconds later"""
@@ -142,7 +156,7 @@ class Trainer:
         if self.social_timer:
             if self.social_frame_interval.can_run():
                 self.social_writer.add_frame(self.image.raw_image)
-                self.gif_writer.add_frame(self.image.raw_image)
+                self.gif_writer.add_frame(self.image.scaled('gif'))
 
             # we ran out of time, post the video
             if self.social_timer.can_run():
@@ -171,8 +185,8 @@ class Trainer:
         self.capture_image()
         self.update_social()
         self.rule.run_once()
-        # sleep for 100ms, because if we are on a low-end rPI the image processing (if allowed to run nonstop) will fully consume the CPU (starving critical things like zigbee)
-        systime.sleep(0.100)
+        # sleep between frames, because if we are on a low-end rPI the image processing (if allowed to run nonstop) will fully consume the CPU (starving critical things like zigbee)
+        self.scheduler.sleep(self.rule.is_active)
 
     def run(self) -> None:
         """Run forever, the app is normally terminated by SIGTERM"""
@@ -184,3 +198,4 @@ class Trainer:
             except CameraDisconnectedError as e:
                 logger.info(f"exiting... { e }")
                 break
+        self.camera.close()
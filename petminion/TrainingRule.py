@@ -103,6 +103,11 @@ class TrainingRule:
         debug_image = self.trainer.image.annotated if self.trainer.image.annotated is not None else self.trainer.image.image
         show_image(debug_image)
 
+    @property
+    def is_active(self) -> bool:
+        """True if the current scene is interesting enough that frames should be processed at the faster rate"""
+        return len(self.trainer.image.detections) > 0
+
     def evaluate_scene(self) -> bool:
         """Evaluate the current scene
 
@@ -259,6 +264,11 @@ class SimpleFeederRule(ScheduledFeederRule):
 
         self.target = target
 
+    @property
+    def is_active(self) -> bool:
+        """True if our target is visible"""
+        return self.is_detected(self.target)
+
     def is_feeding_allowed(self) -> bool:
         """
         Check if feeding is allowed based on the current time and feeding schedule.
@@ -341,6 +351,11 @@ class TokenTrainer(SimpleFeederRule):
         """Returns a string representing the current status of the rule."""
         return f'Fed { self.state.fed_today } of { self.num_allowed() } feedings today ( { self.state.old_count } tokens)'
 
+    @property
+    def is_active(self) -> bool:
+        """True if our target or a token is visible"""
+        return self.is_detected(self.target) or self.is_detected("ball")
+
     def is_feeding_allowed(self) -> bool:
         # If we haven't yet reached the scheduled time, we require a new token for feedings.  Otherwise we allow feedings without a token
         count = self.count_detections("ball")
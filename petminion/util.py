@@ -133,8 +133,17 @@ class AppConfig:
             'MQTTHost': 'localhost',
             'Feeder': 'ZigbeeFeeder',
             'Camera': 'CV2Camera',
+            'CameraFormat': 'UYVY',  # or MJPG to use the camera's JPEG compression (much less USB bandwidth)
+            'CameraDecodeScale': 2,  # MJPG only: decode machine vision frames at 1/1, 1/2, 1/4 or 1/8 resolution
             'TrainingRule': 'SimpleFeederRule',
+            'BallResolution': 'mv',  # the ProcessedImage resolution BallRecognizer uses (mv or small)
             'FastModel': False,
+            'MotionGate': True,  # only run the object detector when the scene changes
+            'MotionFraction': 0.005,  # the fraction of pixels which must change to count as motion
+            'MotionForceSeconds': 30,  # but always run the object detector at least this often
+            'ActiveFramePeriod': 0.2,  # seconds per frame when a pet or token is visible
+            'IdleFramePeriod': 1.0,  # seconds per frame when nothing interesting is visible
+            'DutyCycle': 0.5,  # max fraction of a CPU core the main loop may use (to not starve zigbee)
             'SimFallback': True,
             'SimSocialMedia': False
         }
@@ -0,0 +1,74 @@
+import threading
+
+import numpy as np
+import pytest
+
+from petminion.Camera import CameraDisconnectedError
+from petminion.FrameGrabber import FrameGrabber
+
+
+class FakeDevice:
+    """Produces numbered frames, optionally blocking until the test releases them"""
+
+    def __init__(self, num_frames: int, gated: bool = False):
+        self.num_frames = num_frames
+        self.count = 0
+        self.gate = threading.Semaphore(0) if gated else None
+
+    def read(self, into):
+        if self.gate:
+            self.gate.acquire()
+        if self.count >= self.num_frames:
+            raise IOError("unplugged")
+        if into is None:
+            into = np.zeros((4, 4), dtype=np.uint8)
+        into[:] = self.count
+        self.count += 1
+        return into
+
+
+def test_grabber_returns_newest_frame():
+    dev = FakeDevice(10, gated=True)
+    g = FrameGrabber(dev.read)
+    dev.gate.release()
+    assert g.latest()[0, 0] == 0
+
+    # let three frames arrive while the 'consumer' is busy, only the newest should be returned
+    for _ in range(3):
+        dev.gate.release()
+    first = g.latest()
+    while g.captured_frames < 4:
+        first = g.latest()
+    assert first[0, 0] == 3
+    assert g.dropped_frames + 4 >= g.captured_frames
+
+    # unplug the device so the capture thread exits
+    dev.num_frames = 0
+    dev.gate.release()
+    g.stop()
+
+
+def test_grabber_does_not_overwrite_consumed_frame():
+    dev = FakeDevice(50, gated=True)
+    g = FrameGrabber(dev.read)
+    dev.gate.release()
+    frame = g.latest()
+    assert frame[0, 0] == 0
+
+    # keep holding our frame while the device produces all the rest (and then unplugs)
+    for _ in range(50):
+        dev.gate.release()
+    g._thread.join(timeout=5.0)
+    assert g.captured_frames == 50
+    assert frame[0, 0] == 0
+
+    # the newest frame is still available, then we see the disconnect
+    assert g.latest()[0, 0] == 49
+    with pytest.raises(CameraDisconnectedError):
+        g.latest()
+
+
+def test_grabber_reports_disconnect():
+    g = FrameGrabber(FakeDevice(0).read)
+    with pytest.raises(CameraDisconnectedError):
+        g.latest(timeout=1.0)
@@ -0,0 +1,22 @@
+from petminion.LoopScheduler import LoopScheduler
+
+
+def test_idle_and_active_periods():
+    s = LoopScheduler(active_period=0.2, idle_period=1.0, duty_cycle=0.5)
+    assert s.next_delay(0.05, is_active=False) == 0.95
+    assert abs(s.next_delay(0.05, is_active=True) - 0.15) < 1e-9
+    assert s.rate == 5.0
+
+
+def test_slow_iterations_respect_duty_cycle():
+    s = LoopScheduler(active_period=0.2, idle_period=1.0, duty_cycle=0.5)
+    for _ in range(50):
+        delay = s.next_delay(0.4, is_active=True)
+    # each frame takes 400 ms, so to stay at 50% CPU we must also sleep about 400ms
+    assert abs(delay - 0.4) < 0.01
+    assert abs(s.period - 0.8) < 0.02
+
+
+def test_min_sleep():
+    s = LoopScheduler(active_period=0.0, idle_period=0.0, duty_cycle=1.0, min_sleep=0.01)
+    assert s.next_delay(0.5, is_active=True) == 0.01
@@ -0,0 +1,54 @@
+import os
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+from freezegun import freeze_time
+
+from petminion.MotionGate import MotionGate
+from petminion.Recognizer import ImageDetection, Recognizer
+
+
+def make_gate(**kwargs) -> tuple[MotionGate, MagicMock]:
+    inner = Recognizer()
+    inner.do_detection = MagicMock(return_value=[ImageDetection("cat")])
+    return MotionGate(inner, **kwargs), inner.do_detection
+
+
+def test_static_scene_is_skipped(test_image_dir):
+    img = cv2.imread(os.path.join(test_image_dir, 'cat.jpg'))
+    gate, detect = make_gate()
+    for _ in range(10):
+        assert gate.do_detection(img) == [ImageDetection("cat")]
+    assert detect.call_count == 1
+    assert gate.skip_ratio == 0.9
+
+
+def test_motion_triggers_detection(test_image_dir):
+    img = cv2.imread(os.path.join(test_image_dir, 'cat.jpg'))
+    gate, detect = make_gate()
+    gate.do_detection(img)
+
+    moved = img.copy()
+    h, w = moved.shape[:2]
+    cv2.rectangle(moved, (0, 0), (w // 4, h // 4), (255, 255, 255), -1)
+    gate.do_detection(moved)
+    assert detect.call_count == 2
+
+    # small amounts of sensor noise should not count as motion
+    noisy = cv2.add(moved, np.full(moved.shape, 3, dtype=np.uint8))
+    gate.do_detection(noisy)
+    assert detect.call_count == 2
+
+
+def test_detection_forced_after_interval(test_image_dir):
+    img = cv2.imread(os.path.join(test_image_dir, 'cat.jpg'))
+    with freeze_time("2022-01-01 06:00:00") as ft:
+        gate, detect = make_gate(force_interval=10)
+        gate.do_detection(img)
+        ft.tick(5)
+        gate.do_detection(img)
+        assert detect.call_count == 1
+        ft.tick(6)
+        gate.do_detection(img)
+        assert detect.call_count == 2
@@ -0,0 +1,53 @@
+import numpy as np
+
+from petminion.ProcessedImage import ProcessedImage
+from petminion.Recognizer import ImageDetection, Recognizer
+
+
+class BoxRecognizer(Recognizer):
+    """Always finds a box covering the middle of whatever image it is given"""
+
+    def __init__(self, resolution: str):
+        super().__init__()
+        self.resolution = resolution
+        self.shapes = []
+
+    def do_detection(self, image: np.ndarray) -> list[ImageDetection]:
+        self.shapes.append(image.shape)
+        h, w = image.shape[:2]
+        return [ImageDetection("box", 1.0, w // 4, h // 4, w * 3 // 4, h * 3 // 4)]
+
+
+def test_pyramid_is_cached():
+    p = ProcessedImage([], np.zeros((1080, 1920, 3), dtype=np.uint8))
+    assert p.image.shape == (480, 640, 3)
+    assert p.image is p.scaled('mv')
+    assert p.scaled('small').shape == (240, 320, 3)
+    assert p.scaled('small') is p.scaled('small')
+    assert p.scaled('gif').shape == (180, 320, 3)  # keeps the aspect ratio of the capture
+    assert p.scaled('full') is p.raw_image
+
+
+def test_full_image_is_lazy():
+    calls = []
+
+    def full():
+        calls.append(1)
+        return np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    p = ProcessedImage([], np.zeros((540, 960, 3), dtype=np.uint8), full)
+    assert p.image.shape == (480, 640, 3)
+    assert not calls
+    assert p.raw_image.shape == (1080, 1920, 3)
+    assert p.raw_image is p.raw_image
+    assert len(calls) == 1
+
+
+def test_detections_mapped_to_mv_coordinates():
+    small = BoxRecognizer('small')
+    mv = BoxRecognizer('mv')
+    p = ProcessedImage([small, mv], np.zeros((1080, 1920, 3), dtype=np.uint8))
+    d = p.detections
+    assert small.shapes == [(240, 320, 3)]
+    assert mv.shapes == [(480, 640, 3)]
+    assert d[0] == d[1] == ImageDetection("box", 1.0, 160, 120, 480, 360)